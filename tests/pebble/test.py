@@ -1,22 +1,32 @@
 # pyright: reportPrivateUsage=false
 from __future__ import annotations
 
-import unittest.mock
+import json
+import logging
+import operator
 import os
 import pathlib
+import shutil
 import socket
 import string
-import subprocess
-from typing import Iterator
+import types
+from typing import Any, Callable, Iterable, Iterator, Mapping
 
-import ops
 import pytest
-from file_operations import FileOperations, _errors
-from file_operations import _fileinfo
+
+# skip before importing ops and file_operations, so skipped runs don't pay for them
+if os.getenv('RUN_REAL_PEBBLE_TESTS') != '1':
+    pytest.skip('RUN_REAL_PEBBLE_TESTS not set', allow_module_level=True)
+
+import ops  # noqa: E402
+from file_operations import FileOperations, _errors  # noqa: E402
+from file_operations import _fileinfo  # noqa: E402
 
 
 DEBUG: bool = True
-"""Write debugging info to files during tests."""
+"""Write debugging info to debugging.jsonl in pytest's base temporary directory during tests."""
+
+logger = logging.getLogger(__name__)
 
 
 # modes
@@ -52,122 +62,182 @@ _MODES: tuple[str | None, ...] = (
     *BAD_PARENT_DIRECTORY_MODES_NO_CREATE,
     *BAD_PARENT_DIRECTORY_MODES_CREATE
 )
-ALL_MODES: tuple[str | None, ...] = tuple(reversed(sorted(_MODES, key=str)))
+ALL_MODES: tuple[str | None, ...] = tuple(sorted(dict.fromkeys(_MODES), key=str, reverse=True))
+
+
+def mode_params(modes: Iterable[str | None]) -> list[Any]:
+    """Parametrize ('mode', 'permissions'), parsing each octal mode string once at import."""
+    return [
+        pytest.param(mode, int(mode, base=8) if mode is not None else None, id=str(mode))
+        for mode in modes
+    ]
+
+
+# glob patterns for list_files
+PATTERNS: tuple[str, ...] = (
+    '*.csv',  # no matches
+    '*.bin',
+    '*.txt',
+    '**.txt',
+    '***.txt',
+    '*',
+    # matching the file socket.socket
+    '*.socket',
+    'socket.*',
+    'socket.socket',
+    '?ocket.socket',
+    '[a-z]*.socket',
+    '[a-z]ocket.*',
+    '[a-z]oc*et.*c[b-m]?t',
+)
+
+RELATIVE_PATH: pathlib.Path = pathlib.Path('path.test')
+ALL_BYTES: bytes = bytes(range(256))
+# sort key for lists of ops.pebble.FileInfo
+BY_NAME = operator.attrgetter('name')
+# ops.pebble.FileInfo fields compared between container and local results
+FILEINFO_ATTRS: tuple[str, ...] = tuple(name for name in ops.pebble.FileInfo.__annotations__ if name != 'last_modified')
+assert FILEINFO_ATTRS, 'no fields found in ops.pebble.FileInfo annotations, comparisons would pass vacuously'
+
 
+@pytest.fixture(scope='session')
+def pebble_client() -> ops.pebble.Client:
+    return ops.pebble.Client(socket_path=get_socket_path())
 
-@pytest.fixture
-def container() -> ops.Container:
+
+@pytest.fixture(scope='session')
+def container(pebble_client: ops.pebble.Client) -> ops.Container:
     class dummy_backend:
         class _juju_context:
             version = "9000"
     return ops.Container(
         name="test",
         backend=dummy_backend,  # pyright: ignore[reportArgumentType]
-        pebble_client=ops.pebble.Client(socket_path=get_socket_path()),
+        pebble_client=pebble_client,
     )
 
 
+@pytest.fixture(params=['container', 'no_container'])
+def file_operations(request: pytest.FixtureRequest, container: ops.Container) -> FileOperations:
+    """For tests that check each backend on its own, rather than comparing their results."""
+    return FileOperations(container) if request.param == 'container' else FileOperations()
+
+
 def get_socket_path() -> str:
     socket_path = os.getenv('PEBBLE_SOCKET')
     pebble_path = os.getenv('PEBBLE')
     if not socket_path and pebble_path:
-        assert isinstance(pebble_path, str)
         socket_path = os.path.join(pebble_path, '.pebble.socket')
     assert socket_path, 'PEBBLE or PEBBLE_SOCKET must be set if RUN_REAL_PEBBLE_TESTS set'
     return socket_path
 
 
-@pytest.fixture
-def text_files() -> dict[str, str]:
-    return {
+@pytest.fixture(scope='session')
+def write_for_debugging(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Callable[..., None]]:
+    """Append debugging info as JSON lines to a single file for the whole session.
+
+    If DEBUG is False, this is a no-op and no file is created.
+    """
+    if not DEBUG:
+        yield lambda identifier, **kwargs: None
+        return
+
+    fd = os.open(
+        tmp_path_factory.getbasetemp() / 'debugging.jsonl',
+        os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+        0o644,
+    )
+
+    def write(identifier: str, **kwargs: object) -> None:
+        record = json.dumps({'identifier': identifier, **kwargs}, default=_to_json)
+        os.write(fd, f'{record}\n'.encode())
+
+    try:
+        yield write
+    finally:
+        os.close(fd)
+
+
+def _to_json(obj: object) -> object:
+    if isinstance(obj, ops.pebble.FileInfo):
+        return vars(obj)
+    return str(obj)  # e.g. ops.pebble.FileType, datetime.datetime
+
+
+@pytest.fixture(scope='session')
+def text_files() -> Mapping[str, str]:
+    # read-only, as it's shared by the whole session
+    return types.MappingProxyType({
         'foo.txt': string.ascii_lowercase,
         'bar.txt': string.ascii_uppercase * 2,
         'baz.txt': '',
-    }
+    })
 
 
-@pytest.fixture
-def interesting_dir(tmp_path: pathlib.Path, text_files: dict[str, str]) -> Iterator[pathlib.Path]:
-    (tmp_path / 'empty_dir').mkdir()
-    empty_file = (tmp_path / 'empty_file.bin')
+@pytest.fixture(scope='session')
+def interesting_dir(tmp_path_factory: pytest.TempPathFactory, text_files: Mapping[str, str]) -> Iterator[pathlib.Path]:
+    # shared by the whole session, so tests must not modify it
+    directory = tmp_path_factory.mktemp('interesting', numbered=False)
+    (directory / 'empty_dir').mkdir()
+    empty_file = (directory / 'empty_file.bin')
     empty_file.touch()
-    (tmp_path / 'symlink.bin').symlink_to(empty_file)
-    (tmp_path / 'symlink_dir').symlink_to(tmp_path / 'empty_dir')
-    (tmp_path / 'symlink_rec').symlink_to(tmp_path)
-    (tmp_path / 'binary_file.bin').write_bytes(bytearray(range(256)))
+    (directory / 'symlink.bin').symlink_to(empty_file)
+    (directory / 'symlink_dir').symlink_to(directory / 'empty_dir')
+    (directory / 'symlink_rec').symlink_to(directory)
+    (directory / 'binary_file.bin').write_bytes(ALL_BYTES)
     for filename, contents in text_files.items():
-        (tmp_path / filename).write_text(contents)
+        (directory / filename).write_text(contents)
     sock = socket.socket(socket.AddressFamily.AF_UNIX)
-    sock.bind(str(tmp_path / 'socket.socket'))
+    sock.bind(str(directory / 'socket.socket'))
     # TODO: make block device?
     try:
-        yield tmp_path
+        yield directory
     finally:
         sock.shutdown(socket.SHUT_RDWR)
         sock.close()
 
 
-@pytest.mark.skipif(
-    os.getenv('RUN_REAL_PEBBLE_TESTS') != '1',
-    reason='RUN_REAL_PEBBLE_TESTS not set',
-)
 class TestListFiles:
     @staticmethod
-    def test_ok(container: ops.Container, interesting_dir: pathlib.Path):
+    def test_ok(container: ops.Container, interesting_dir: pathlib.Path, write_for_debugging: Callable[..., None]):
         with_container = FileOperations(container).list_files(interesting_dir)
         without_container = FileOperations().list_files(interesting_dir)
-        with_container.sort(key=lambda fileinfo: fileinfo.name)
-        without_container.sort(key=lambda fileinfo: fileinfo.name)
+        with_container.sort(key=BY_NAME)
+        without_container.sort(key=BY_NAME)
         write_for_debugging(
             'list_files_ok',
             with_container=with_container,
             without_container=without_container,
         )
-        with unittest.mock.patch.object(ops.pebble.FileInfo, '__eq__', fileinfo_eq):
-            assert with_container == without_container
+        assert_fileinfo_list_eq(with_container, without_container)
 
     @staticmethod
-    @pytest.mark.parametrize(
-        'pattern',
-        [
-            '*.csv',  # no matches
-            '*.bin',
-            '*.txt',
-            '**.txt',
-            '***.txt',
-            '*',
-            # matching the file socket.socket
-            '*.socket',
-            'socket.*',
-            'socket.socket',
-            '?ocket.socket',
-            '[a-z]*.socket',
-            '[a-z]ocket.*',
-            '[a-z]oc*et.*c[b-m]?t',
-        ],
-    )
-    def test_pattern_ok(container: ops.Container, interesting_dir: pathlib.Path, pattern: str):
+    @pytest.mark.parametrize('pattern', PATTERNS)
+    def test_pattern_ok(
+        container: ops.Container,
+        interesting_dir: pathlib.Path,
+        pattern: str,
+        write_for_debugging: Callable[..., None],
+    ):
         with_container = FileOperations(container).list_files(interesting_dir, pattern=pattern)
         without_container = FileOperations().list_files(interesting_dir, pattern=pattern)
-        with_container.sort(key=lambda fileinfo: fileinfo.name)
-        without_container.sort(key=lambda fileinfo: fileinfo.name)
+        with_container.sort(key=BY_NAME)
+        without_container.sort(key=BY_NAME)
         write_for_debugging(
-            f'list_files_pattern_ok_{"".join(c if c.isalnum() else "_" for c in pattern)}',
+            f'list_files_pattern_ok_{pattern}',
             with_container=with_container,
             without_container=without_container,
         )
-        with unittest.mock.patch.object(ops.pebble.FileInfo, '__eq__', fileinfo_eq):
-            assert with_container == without_container
+        assert_fileinfo_list_eq(with_container, without_container)
 
     @staticmethod
-    def test_pattern_ok_text_files(container: ops.Container, interesting_dir: pathlib.Path, text_files: dict[str, str]):
+    def test_pattern_ok_text_files(container: ops.Container, interesting_dir: pathlib.Path, text_files: Mapping[str, str]):
         pattern = '*.txt'
         with_container = FileOperations(container).list_files(interesting_dir, pattern=pattern)
         without_container = FileOperations().list_files(interesting_dir, pattern=pattern)
-        with_container.sort(key=lambda fileinfo: fileinfo.name)
-        without_container.sort(key=lambda fileinfo: fileinfo.name)
-        with unittest.mock.patch.object(ops.pebble.FileInfo, '__eq__', fileinfo_eq):
-            assert with_container == without_container
+        with_container.sort(key=BY_NAME)
+        without_container.sort(key=BY_NAME)
+        assert_fileinfo_list_eq(with_container, without_container)
         # extra validation
         assert sorted(fileinfo.name for fileinfo in with_container) == sorted(text_files)
 
@@ -176,23 +246,18 @@ class TestListFiles:
         pattern = '*.nomatches'
         with_container = FileOperations(container).list_files(interesting_dir, pattern=pattern)
         without_container = FileOperations().list_files(interesting_dir, pattern=pattern)
-        with_container.sort(key=lambda fileinfo: fileinfo.name)
-        without_container.sort(key=lambda fileinfo: fileinfo.name)
-        with unittest.mock.patch.object(ops.pebble.FileInfo, '__eq__', fileinfo_eq):
-            assert with_container == without_container
+        with_container.sort(key=BY_NAME)
+        without_container.sort(key=BY_NAME)
+        assert_fileinfo_list_eq(with_container, without_container)
         # extra validation
         assert len(with_container) == 0
 
     @staticmethod
-    def test_given_bad_pattern_when_list_files_then_api_error(container: ops.Container, interesting_dir: pathlib.Path):
+    def test_given_bad_pattern_when_list_files_then_api_error(file_operations: FileOperations, interesting_dir: pathlib.Path):
         pattern = '[foo'
         with pytest.raises(ops.pebble.APIError) as exception_context:
-            FileOperations(container).list_files(interesting_dir, pattern=pattern)
-        print(exception_context.value)
-        assert _errors.API.BadRequest.matches(exception_context.value)
-        with pytest.raises(ops.pebble.APIError) as exception_context:
-            FileOperations().list_files(interesting_dir, pattern=pattern)
-        print(exception_context.value)
+            file_operations.list_files(interesting_dir, pattern=pattern)
+        logger.debug('%s', exception_context.value)
         assert _errors.API.BadRequest.matches(exception_context.value)
 
     @staticmethod
@@ -200,121 +265,97 @@ class TestListFiles:
         pattern = '[foo'
         with_container = FileOperations(container).list_files(tmp_path, pattern=pattern)
         without_container = FileOperations().list_files(tmp_path, pattern=pattern)
-        with_container.sort(key=lambda fileinfo: fileinfo.name)
-        without_container.sort(key=lambda fileinfo: fileinfo.name)
-        with unittest.mock.patch.object(ops.pebble.FileInfo, '__eq__', fileinfo_eq):
-            assert with_container == without_container
+        with_container.sort(key=BY_NAME)
+        without_container.sort(key=BY_NAME)
+        assert_fileinfo_list_eq(with_container, without_container)
 
     @staticmethod
     def test_itself_ok(container: ops.Container, interesting_dir: pathlib.Path):
         with_container = FileOperations(container).list_files(interesting_dir, itself=True)
         without_container = FileOperations().list_files(interesting_dir, itself=True)
-        with_container.sort(key=lambda fileinfo: fileinfo.name)
-        without_container.sort(key=lambda fileinfo: fileinfo.name)
-        with unittest.mock.patch.object(ops.pebble.FileInfo, '__eq__', fileinfo_eq):
-            assert with_container == without_container
+        with_container.sort(key=BY_NAME)
+        without_container.sort(key=BY_NAME)
+        assert_fileinfo_list_eq(with_container, without_container)
 
     @staticmethod
-    def test_itself_pattern_ok(container: ops.Container, interesting_dir: pathlib.Path):
+    def test_itself_pattern_ok(container: ops.Container, interesting_dir: pathlib.Path, write_for_debugging: Callable[..., None]):
         pattern = '*'
         with_container = FileOperations(container).list_files(interesting_dir, pattern=pattern)
         without_container = FileOperations().list_files(interesting_dir, pattern=pattern)
-        with_container.sort(key=lambda fileinfo: fileinfo.name)
-        without_container.sort(key=lambda fileinfo: fileinfo.name)
+        with_container.sort(key=BY_NAME)
+        without_container.sort(key=BY_NAME)
         write_for_debugging(
             'list_files_itself_pattern_ok',
             with_container=with_container,
             without_container=without_container,
         )
-        with unittest.mock.patch.object(ops.pebble.FileInfo, '__eq__', fileinfo_eq):
-            assert with_container == without_container
+        assert_fileinfo_list_eq(with_container, without_container)
 
     @staticmethod
-    def test_itself_pattern_no_matches(container: ops.Container, interesting_dir: pathlib.Path):
+    def test_itself_pattern_no_matches(container: ops.Container, interesting_dir: pathlib.Path, write_for_debugging: Callable[..., None]):
         pattern = '*.nomatches'
         with_container = FileOperations(container).list_files(interesting_dir, pattern=pattern)
         without_container = FileOperations().list_files(interesting_dir, pattern=pattern)
-        with_container.sort(key=lambda fileinfo: fileinfo.name)
-        without_container.sort(key=lambda fileinfo: fileinfo.name)
+        with_container.sort(key=BY_NAME)
+        without_container.sort(key=BY_NAME)
         write_for_debugging(
             'list_files_itself_pattern_no_matches',
             with_container=with_container,
             without_container=without_container,
         )
-        with unittest.mock.patch.object(ops.pebble.FileInfo, '__eq__', fileinfo_eq):
-            assert with_container == without_container
+        assert_fileinfo_list_eq(with_container, without_container)
 
     @staticmethod
-    def test_given_bad_pattern_when_list_files_with_itself_then_api_error(container: ops.Container, interesting_dir: pathlib.Path):
+    def test_given_bad_pattern_when_list_files_with_itself_then_api_error(file_operations: FileOperations, interesting_dir: pathlib.Path):
         pattern = '[foo'
         with pytest.raises(ops.pebble.APIError) as exception_context:
-            FileOperations(container).list_files(interesting_dir, pattern=pattern, itself=True)
-        print(exception_context.value)
-        assert _errors.API.BadRequest.matches(exception_context.value)
-        with pytest.raises(ops.pebble.APIError) as exception_context:
-            FileOperations().list_files(interesting_dir, pattern=pattern, itself=True)
-        print(exception_context.value)
+            file_operations.list_files(interesting_dir, pattern=pattern, itself=True)
+        logger.debug('%s', exception_context.value)
         assert _errors.API.BadRequest.matches(exception_context.value)
 
     @staticmethod
-    def test_target_doesnt_exist(container: ops.Container, tmp_path: pathlib.Path):
+    def test_target_doesnt_exist(file_operations: FileOperations, tmp_path: pathlib.Path):
         path = (tmp_path / 'does/not/exist/')
-        # with container
-        with pytest.raises(ops.pebble.APIError) as exception_context:
-            FileOperations(container).list_files(path)
-        print(exception_context.value)
-        assert _errors.API.FileNotFound.matches(exception_context.value)
-        # without container
         with pytest.raises(ops.pebble.APIError) as exception_context:
-            FileOperations().list_files(path)
-        print(exception_context.value)
+            file_operations.list_files(path)
+        logger.debug('%s', exception_context.value)
         assert _errors.API.FileNotFound.matches(exception_context.value)
 
 
-@pytest.mark.skipif(
-    os.getenv('RUN_REAL_PEBBLE_TESTS') != '1',
-    reason='RUN_REAL_PEBBLE_TESTS not set',
-)
 class TestMakeDir:
     @staticmethod
-    def test_ok(container: ops.Container, tmp_path: pathlib.Path):
+    def test_ok(file_operations: FileOperations, tmp_path: pathlib.Path):
         directory = tmp_path / 'directory'
-        FileOperations(container).make_dir(directory)
-        assert directory.exists()
-        rmdir(directory)
-        FileOperations().make_dir(directory)
+        file_operations.make_dir(directory)
         assert directory.exists()
         rmdir(directory)
 
     @staticmethod
-    def test_directory_already_exists(container: ops.Container, tmp_path: pathlib.Path):
+    def test_directory_already_exists(file_operations: FileOperations, tmp_path: pathlib.Path):
         directory = tmp_path / 'directory'
-        pathlib.Path(directory).mkdir(exist_ok=True, parents=True)
-        # with container
+        directory.mkdir(exist_ok=True, parents=True)
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(directory)
-        print(exception_context.value)
-        assert _errors.Path.FileExists.matches(exception_context.value)
-        # without container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(directory)
-        print(exception_context.value)
+            file_operations.make_dir(directory)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.FileExists.matches(exception_context.value)
 
     @staticmethod
-    @pytest.mark.parametrize('mode', ALL_MODES)
-    def test_permissions(container: ops.Container, tmp_path: pathlib.Path, mode: str | None):
-        permissions = int(f'0o{mode}', base=8) if mode is not None else mode
+    @pytest.mark.parametrize(('mode', 'permissions'), mode_params(ALL_MODES))
+    def test_permissions(
+        container: ops.Container,
+        tmp_path: pathlib.Path,
+        mode: str | None,
+        permissions: int | None,
+        write_for_debugging: Callable[..., None],
+    ):
         directory = tmp_path / 'directory'
         # container
-        assert not directory.exists()
         FileOperations(container).make_dir(directory,make_parents=True, permissions=permissions)
         assert directory.exists()
         info_dir_c = _fileinfo.from_path(directory)
         # cleanup
         rmdir(directory)
         # no container
-        assert not directory.exists()
         FileOperations().make_dir(directory,make_parents=True, permissions=permissions)
         assert directory.exists()
         info_dir = _fileinfo.from_path(directory)
@@ -329,33 +370,32 @@ class TestMakeDir:
         assert_fileinfo_eq(info_dir, info_dir_c)
 
     @staticmethod
-    @pytest.mark.parametrize('mode', GOOD_PARENT_DIRECTORY_MODES)
-    def test_subdirectory_make_parents(container: ops.Container, tmp_path: pathlib.Path, mode: str | None):
-        permissions = int(f'0o{mode}', base=8) if mode is not None else mode
+    @pytest.mark.parametrize(('mode', 'permissions'), mode_params(GOOD_PARENT_DIRECTORY_MODES))
+    def test_subdirectory_make_parents(
+        container: ops.Container,
+        tmp_path: pathlib.Path,
+        mode: str | None,
+        permissions: int | None,
+        write_for_debugging: Callable[..., None],
+    ):
         directory = tmp_path / 'directory'
         subdirectory = directory / 'subdirectory'
         # container
-        assert not subdirectory.exists()
-        assert not directory.exists()
         FileOperations(container).make_dir(subdirectory,make_parents=True, permissions=permissions)
         assert directory.exists()
         assert subdirectory.exists()
         info_sub_c = _fileinfo.from_path(subdirectory)
         info_dir_c = _fileinfo.from_path(directory)
         # cleanup
-        rmdir(subdirectory)
-        rmdir(directory)
+        rmtree(directory)
         # no container
-        assert not subdirectory.exists()
-        assert not directory.exists()
         FileOperations().make_dir(subdirectory,make_parents=True, permissions=permissions)
         assert directory.exists()
         assert subdirectory.exists()
         info_sub = _fileinfo.from_path(subdirectory)
         info_dir = _fileinfo.from_path(directory)
         # cleanup -- pytest is bad at cleaning up when permissions are funky
-        rmdir(subdirectory)
-        rmdir(directory)
+        rmtree(directory)
         # comparison
         write_for_debugging(
             f'make_dir_subdirectory_make_parents_{mode}',
@@ -368,194 +408,117 @@ class TestMakeDir:
         assert_fileinfo_eq(info_dir, info_dir_c)
 
     @staticmethod
-    @pytest.mark.parametrize('mode', BAD_PARENT_DIRECTORY_MODES_NO_CREATE)
-    def test_subdirectory_make_parents_bad_permissions_no_create(container: ops.Container, tmp_path: pathlib.Path, mode: str | None):
+    @pytest.mark.parametrize(('mode', 'permissions'), mode_params(BAD_PARENT_DIRECTORY_MODES_NO_CREATE))
+    def test_subdirectory_make_parents_bad_permissions_no_create(
+        container: ops.Container,
+        tmp_path: pathlib.Path,
+        mode: str | None,
+        permissions: int | None,
+        write_for_debugging: Callable[..., None],
+    ):
         """The permissions are bad because they lack the execute permission.
 
         This means that directory is created without the ability to write to it,
         and subdirectory creation then fails with a permission error.
         """
-        permissions = int(f'0o{mode}', base=8) if mode is not None else mode
-        directory = tmp_path / 'directory'
-        subdirectory = directory / 'subdirectory'
-        # container
-        assert not subdirectory.exists()
-        assert not directory.exists()
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(subdirectory,make_parents=True, permissions=permissions)
-        print(exception_context.value)
-        assert _errors.Path.Permission.matches(exception_context.value)
-        assert directory.exists()
-        info_dir_c = _fileinfo.from_path(directory)
-        os.chmod(directory, 0o755)
-        assert not subdirectory.exists()
-        # cleanup
-        rmdir(directory)
-        # no container
-        assert not subdirectory.exists()
-        assert not directory.exists()
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(subdirectory,make_parents=True, permissions=permissions)
-        print(exception_context.value)
-        assert _errors.Path.Permission.matches(exception_context.value)
-        assert directory.exists()
-        info_dir = _fileinfo.from_path(directory)
-        os.chmod(directory, 0o755)
-        assert not subdirectory.exists()
-        # cleanup -- pytest is bad at cleaning up when permissions are funky
-        rmdir(directory)
-        # comparison
+        subdirectory = tmp_path / 'directory' / 'subdirectory'
+        infos_c = make_subdirectory_bad_permissions(FileOperations(container), subdirectory, permissions, created=False)
+        infos = make_subdirectory_bad_permissions(FileOperations(), subdirectory, permissions, created=False)
         write_for_debugging(
-            f'make_dir_subdirectory_make_parents_{mode}',
-            info_dir_c=info_dir_c,
-            info_dir=info_dir,
+            f'make_dir_subdirectory_make_parents_bad_permissions_no_create_{mode}',
+            infos_c=infos_c,
+            infos=infos,
         )
-        assert_fileinfo_eq(info_dir, info_dir_c)
+        for info, info_c in zip(infos, infos_c):
+            assert_fileinfo_eq(info, info_c)
 
     @staticmethod
-    @pytest.mark.parametrize('mode', BAD_PARENT_DIRECTORY_MODES_CREATE)
-    def test_subdirectory_make_parents_bad_permissions_create(container: ops.Container, tmp_path: pathlib.Path, mode: str | None):
+    @pytest.mark.parametrize(('mode', 'permissions'), mode_params(BAD_PARENT_DIRECTORY_MODES_CREATE))
+    def test_subdirectory_make_parents_bad_permissions_create(
+        container: ops.Container,
+        tmp_path: pathlib.Path,
+        mode: str | None,
+        permissions: int | None,
+        write_for_debugging: Callable[..., None],
+    ):
         """The permissions are bad because they lack the read permission.
 
         Pebble must try some operation that requires read permissions on the parent directory
         after creating the file inside it.
         """
-        permissions = int(f'0o{mode}', base=8) if mode is not None else mode
-        directory = tmp_path / 'directory'
-        subdirectory = directory / 'subdirectory'
-        # container
-        assert not subdirectory.exists()
-        assert not directory.exists()
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(subdirectory,make_parents=True, permissions=permissions)
-        print(exception_context.value)
-        assert _errors.Path.Permission.matches(exception_context.value)
-        assert directory.exists()
-        info_dir_c = _fileinfo.from_path(directory)
-        info_subdir_c = _fileinfo.from_path(subdirectory)
-        os.chmod(directory, 0o755)
-        assert subdirectory.exists()
-        # cleanup
-        rmdir(subdirectory)
-        rmdir(directory)
-        # no container
-        assert not subdirectory.exists()
-        assert not directory.exists()
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(subdirectory,make_parents=True, permissions=permissions)
-        print(exception_context.value)
-        assert _errors.Path.Permission.matches(exception_context.value)
-        assert directory.exists()
-        info_dir = _fileinfo.from_path(directory)
-        info_subdir = _fileinfo.from_path(subdirectory)
-        os.chmod(directory, 0o755)
-        assert subdirectory.exists()
-        # cleanup -- pytest is bad at cleaning up when permissions are funky
-        rmdir(subdirectory)
-        rmdir(directory)
-        # comparison
+        subdirectory = tmp_path / 'directory' / 'subdirectory'
+        infos_c = make_subdirectory_bad_permissions(FileOperations(container), subdirectory, permissions, created=True)
+        infos = make_subdirectory_bad_permissions(FileOperations(), subdirectory, permissions, created=True)
         write_for_debugging(
-            f'make_dir_subdirectory_make_parents_{mode}',
-            info_dir_c=info_dir_c,
-            info_dir=info_dir,
-            info_subdir_c=info_subdir_c,
-            info_subdir=info_subdir,
+            f'make_dir_subdirectory_make_parents_bad_permissions_create_{mode}',
+            infos_c=infos_c,
+            infos=infos,
         )
-        assert_fileinfo_eq(info_dir, info_dir_c)
-        assert_fileinfo_eq(info_subdir, info_subdir_c)
+        for info, info_c in zip(infos, infos_c):
+            assert_fileinfo_eq(info, info_c)
 
     @staticmethod
-    @pytest.mark.parametrize('mode', BAD_PARENT_DIRECTORY_MODES_CREATE)
-    def test_subdirectory_make_parents_bad_permissions_create_nested(container: ops.Container, tmp_path: pathlib.Path, mode: str | None):
+    @pytest.mark.parametrize(('mode', 'permissions'), mode_params(BAD_PARENT_DIRECTORY_MODES_CREATE))
+    def test_subdirectory_make_parents_bad_permissions_create_nested(
+        container: ops.Container,
+        tmp_path: pathlib.Path,
+        mode: str | None,
+        permissions: int | None,
+        write_for_debugging: Callable[..., None],
+    ):
         """The permissions are bad because they lack the read permission.
 
         Pebble must try some operation that requires read permissions on the parent directory
         after creating the file inside it.
         """
-        permissions = int(f'0o{mode}', base=8) if mode is not None else mode
-        directory = tmp_path / 'directory'
-        subdirectory = directory / 'subdirectory'
+        subdirectory = tmp_path / 'directory' / 'subdirectory'
         subsubdirectory = subdirectory / 'subsubdirectory'
-        # container
-        assert not subsubdirectory.exists()
-        assert not subdirectory.exists()
-        assert not directory.exists()
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(subdirectory,make_parents=True, permissions=permissions)
-        print(exception_context.value)
-        assert _errors.Path.Permission.matches(exception_context.value)
-        assert directory.exists()
-        info_dir_c = _fileinfo.from_path(directory)
-        os.chmod(directory, 0o755)
-        assert subdirectory.exists()
-        info_subdir_c = _fileinfo.from_path(subdirectory)
-        assert not subsubdirectory.exists()
-        # cleanup
-        rmdir(subdirectory)
-        rmdir(directory)
-        # no container
-        assert not subsubdirectory.exists()
-        assert not subdirectory.exists()
-        assert not directory.exists()
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(subdirectory,make_parents=True, permissions=permissions)
-        print(exception_context.value)
-        assert _errors.Path.Permission.matches(exception_context.value)
-        assert directory.exists()
-        info_dir = _fileinfo.from_path(directory)
-        os.chmod(directory, 0o755)
-        assert subdirectory.exists()
-        info_subdir = _fileinfo.from_path(subdirectory)
-        assert not subsubdirectory.exists()
-        # cleanup -- pytest is bad at cleaning up when permissions are funky
-        rmdir(subdirectory)
-        rmdir(directory)
-        # comparison
+        infos_c = make_subdirectory_bad_permissions(
+            FileOperations(container), subdirectory, permissions, created=True, absent=(subsubdirectory,)
+        )
+        infos = make_subdirectory_bad_permissions(
+            FileOperations(), subdirectory, permissions, created=True, absent=(subsubdirectory,)
+        )
         write_for_debugging(
-            f'make_dir_subdirectory_make_parents_{mode}',
-            info_dir_c=info_dir_c,
-            info_dir=info_dir,
-            info_subdir_c=info_subdir_c,
-            info_subdir=info_subdir,
+            f'make_dir_subdirectory_make_parents_bad_permissions_create_nested_{mode}',
+            infos_c=infos_c,
+            infos=infos,
         )
-        assert_fileinfo_eq(info_dir, info_dir_c)
-        assert_fileinfo_eq(info_subdir, info_subdir_c)
+        for info, info_c in zip(infos, infos_c):
+            assert_fileinfo_eq(info, info_c)
 
     @staticmethod
-    def test_given_parent_doesnt_exist_when_make_subdir_without_make_parents_then_failure(container: ops.Container, tmp_path: pathlib.Path):
+    def test_given_parent_doesnt_exist_when_make_subdir_without_make_parents_then_failure(
+        file_operations: FileOperations,
+        tmp_path: pathlib.Path,
+    ):
         directory = tmp_path / 'directory'
         subdirectory = directory / 'subdirectory'
-        # container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(subdirectory)
-        print(exception_context.value)
-        assert _errors.Path.FileNotFound.matches(exception_context.value)
-        assert not subdirectory.exists()
-        assert not directory.exists()
-        # no container
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(subdirectory)
-        print(exception_context.value)
+            file_operations.make_dir(subdirectory)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.FileNotFound.matches(exception_context.value)
-        assert not subdirectory.exists()
-        assert not directory.exists()
+        assert not directory.exists()  # so neither does anything below it
 
     @staticmethod
-    def test_given_parent_doesnt_exist_when_make_subdir_with_make_parents_then_success(container: ops.Container, tmp_path: pathlib.Path):
+    def test_given_parent_doesnt_exist_when_make_subdir_with_make_parents_then_success(
+        file_operations: FileOperations,
+        tmp_path: pathlib.Path,
+    ):
         directory = tmp_path / 'directory'
         subdirectory = directory / 'subdirectory'
         subdirectory.mkdir(parents=True)
-        # with container
-        FileOperations(container).make_dir(subdirectory, make_parents=True)
-        # without container
-        FileOperations().make_dir(subdirectory, make_parents=True)
+        file_operations.make_dir(subdirectory, make_parents=True)
 
     @staticmethod
-    @pytest.mark.parametrize('mode', GOOD_PARENT_DIRECTORY_MODES)
+    @pytest.mark.parametrize(('mode', 'permissions'), mode_params(GOOD_PARENT_DIRECTORY_MODES))
     def test_given_subdir_exists_when_make_subdir_with_make_parents_then_permissions_match(
-        container: ops.Container, tmp_path: pathlib.Path, mode: str | None
+        container: ops.Container,
+        tmp_path: pathlib.Path,
+        mode: str | None,
+        permissions: int | None,
+        write_for_debugging: Callable[..., None],
     ):
-        permissions = int(f'0o{mode}', base=8) if mode is not None else mode
         directory = tmp_path / 'directory'
         subdirectory = directory / 'subdirectory'
         # setup
@@ -566,8 +529,7 @@ class TestMakeDir:
         os.chmod(directory, 0o755)  # so we can read the subdirectory info
         info_subdir_c = _fileinfo.from_path(subdirectory)
         # cleanup
-        rmdir(subdirectory)
-        rmdir(directory)
+        rmtree(directory)
         # setup
         subdirectory.mkdir(parents=True)
         # without container
@@ -576,8 +538,7 @@ class TestMakeDir:
         os.chmod(directory, 0o755)  # so we can read the subdirectory info
         info_subdir = _fileinfo.from_path(subdirectory)
         # cleanup -- pytest is bad at cleaning up when permissions are funky
-        rmdir(subdirectory)
-        rmdir(directory)
+        rmtree(directory)
         # comparison
         write_for_debugging(
             f'make_dir_subdirectory_already_exists_make_parents_permissions_{mode}',
@@ -590,530 +551,338 @@ class TestMakeDir:
         assert_fileinfo_eq(info_subdir, info_subdir_c)
 
     @staticmethod
-    def test_subdirectory_already_exists_no_make_parents(container: ops.Container, tmp_path: pathlib.Path):
+    def test_subdirectory_already_exists_no_make_parents(file_operations: FileOperations, tmp_path: pathlib.Path):
         directory = tmp_path / 'directory'
         subdirectory = directory / 'subdirectory'
         subdirectory.mkdir(parents=True)
-        # with container
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(subdirectory)
+            file_operations.make_dir(subdirectory)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.FileExists.matches(exception_context.value)
-        print(exception_context.value)
-        # without container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(subdirectory)
-        assert _errors.Path.FileExists.matches(exception_context.value)
-        print(exception_context.value)
 
     @staticmethod
-    def test_path_not_absolute(container: ops.Container):
-        path = pathlib.Path('path.test')
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(path)
-        assert _errors.Path.RelativePath.matches(exception_context.value)
+    def test_path_not_absolute(file_operations: FileOperations):
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(path)
+            file_operations.make_dir(RELATIVE_PATH)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.RelativePath.matches(exception_context.value)
 
     @staticmethod
-    def test_chown_root_without_privileges(container: ops.Container, tmp_path: pathlib.Path):
+    def test_chown_root_without_privileges(file_operations: FileOperations, tmp_path: pathlib.Path):
         # TODO: what if we do have root privileges, like in ci?
         user_id = 0
         user_name = 'root'
         directory = tmp_path / 'directory'
-        # with container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(directory, user=user_name, user_id=user_id)
-        print(exception_context.value)
-        assert _errors.Path.Permission.matches(exception_context.value)
-        assert not pathlib.Path(directory).exists()
-        # without container
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(directory, user=user_name, user_id=user_id)
-        print(exception_context.value)
+            file_operations.make_dir(directory, user=user_name, user_id=user_id)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.Permission.matches(exception_context.value)
-        assert not pathlib.Path(directory).exists()
+        assert not directory.exists()
 
     @staticmethod
-    def test_chown_when_user_doesnt_exist(container: ops.Container, tmp_path: pathlib.Path):
+    def test_chown_when_user_doesnt_exist(file_operations: FileOperations, tmp_path: pathlib.Path):
         directory = tmp_path / 'directory'
         # TODO: user that doesn't exist
         user_name = 'fake_user'
-        # with container
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(directory, user=user_name)
-        print(exception_context.value)
+            file_operations.make_dir(directory, user=user_name)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.Lookup.matches(exception_context.value)
-        assert not pathlib.Path(directory).exists()
-        # without container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(directory, user=user_name)
-        print(exception_context.value)
-        assert _errors.Path.Lookup.matches(exception_context.value)
-        assert not pathlib.Path(directory).exists()
+        assert not directory.exists()
 
     @staticmethod
-    def test_chown_when_user_id_and_group_id_dont_exist(container: ops.Container, tmp_path: pathlib.Path):
+    def test_chown_when_user_id_and_group_id_dont_exist(file_operations: FileOperations, tmp_path: pathlib.Path):
         directory = tmp_path / 'directory'
-        # with container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(directory, user_id=9000, group_id=9001)
-        print(exception_context.value)
-        assert _errors.Path.Permission.matches(exception_context.value)
-        assert not pathlib.Path(directory).exists()
-        # without container
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(directory, user_id=9000, group_id=9001)
-        print(exception_context.value)
+            file_operations.make_dir(directory, user_id=9000, group_id=9001)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.Permission.matches(exception_context.value)
-        assert not pathlib.Path(directory).exists()
+        assert not directory.exists()
 
     @staticmethod
-    def test_chown_just_user(container: ops.Container, tmp_path: pathlib.Path):
+    def test_chown_just_user(file_operations: FileOperations, tmp_path: pathlib.Path):
         directory = tmp_path / 'directory'
         # TODO: user that exists
         user_name = 'user'
-        # with container
-        FileOperations(container).make_dir(directory, user=user_name)
+        file_operations.make_dir(directory, user=user_name)
         assert directory.exists()
         rmdir(directory)
-        # without container
-        FileOperations().make_dir(directory, user=user_name)
-        assert directory.exists()
-        rmdir(directory)
-
-    @staticmethod
-    def test_chown_just_user_id(container: ops.Container, tmp_path: pathlib.Path):
-        directory = tmp_path / 'directory'
-        # TODO: user that exists
-        user_id = 1000
-        # with container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(directory, user_id=user_id)
-        assert not directory.exists()
-        assert _errors.Path.Generic.matches(exception_context.value)
-        # without container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(directory, user_id=user_id)
-        assert not directory.exists()
-        assert _errors.Path.Generic.matches(exception_context.value)
-
-    @staticmethod
-    def test_chown_just_group_name(container: ops.Container, tmp_path: pathlib.Path):
-        directory = tmp_path / 'directory'
-        # TODO: user that exists
-        group = 'user'
-        # with container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(directory, group=group)
-        assert not directory.exists()
-        assert _errors.Path.Generic.matches(exception_context.value)
-        # without container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(directory, group=group)
-        assert not directory.exists()
-        assert _errors.Path.Generic.matches(exception_context.value)
 
     @staticmethod
-    def test_chown_just_group_id(container: ops.Container, tmp_path: pathlib.Path):
-        directory = tmp_path / 'directory'
-        # TODO: user that exists
-        group_id = 1000
-        # with container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(directory, group_id=group_id)
-        assert not directory.exists()
-        assert _errors.Path.Generic.matches(exception_context.value)
-        # without container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(directory, group_id=group_id)
-        assert not directory.exists()
-        assert _errors.Path.Generic.matches(exception_context.value)
-
-    @staticmethod
-    def test_chown_just_group_args(container: ops.Container, tmp_path: pathlib.Path):
+    @pytest.mark.parametrize(
+        'kwargs',
+        [
+            {'user_id': 1000},
+            {'group': 'user'},
+            {'group_id': 1000},
+            {'group': 'user', 'group_id': 1000},
+        ],
+        ids=['user_id', 'group', 'group_id', 'group+group_id'],
+    )
+    def test_chown_incomplete_args(file_operations: FileOperations, tmp_path: pathlib.Path, kwargs: dict[str, str | int]):
         directory = tmp_path / 'directory'
         # TODO: user that exists
-        group = 'user'
-        group_id = 1000
-        # with container
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(directory, group=group, group_id=group_id)
-        assert not directory.exists()
+            file_operations.make_dir(directory, **kwargs)  # pyright: ignore[reportArgumentType]
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.Generic.matches(exception_context.value)
-        # without container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(directory, group=group, group_id=group_id)
         assert not directory.exists()
-        assert _errors.Path.Generic.matches(exception_context.value)
 
     @staticmethod
-    def test_chown_when_user_and_user_id_both_exist_but_dont_match(container: ops.Container, tmp_path: pathlib.Path):
+    def test_chown_when_user_and_user_id_both_exist_but_dont_match(file_operations: FileOperations, tmp_path: pathlib.Path):
         directory = tmp_path / 'directory'
         # TODO: find a user and user id combo or way to get it dynamically that
         # will exist at runtime but won't match
         user_id = 0
         user_name = 'user'
-        # with container
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(directory, user=user_name, user_id=user_id)
-        print(exception_context.value)
+            file_operations.make_dir(directory, user=user_name, user_id=user_id)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.Generic.matches(exception_context.value)
-        assert not pathlib.Path(directory).exists()
-        # without container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(directory, user=user_name, user_id=user_id)
-        print(exception_context.value)
-        assert _errors.Path.Generic.matches(exception_context.value)
-        assert not pathlib.Path(directory).exists()
+        assert not directory.exists()
 
     @staticmethod
-    def test_chown_when_user_and_user_id_both_provided_but_at_least_one_doesnt_exist(container: ops.Container, tmp_path: pathlib.Path):
+    def test_chown_when_user_and_user_id_both_provided_but_at_least_one_doesnt_exist(
+        file_operations: FileOperations,
+        tmp_path: pathlib.Path,
+    ):
         # TODO: better way to make user and user_id
         user_id = 9000
         user_name = 'user-that-doesnt-exist-hopefully'
         directory = tmp_path / 'directory'
-        # with container
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).make_dir(directory, user=user_name, user_id=user_id)
-        print(exception_context.value)
+            file_operations.make_dir(directory, user=user_name, user_id=user_id)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.Lookup.matches(exception_context.value)
-        assert not pathlib.Path(directory).exists()
-        # without container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(directory, user=user_name, user_id=user_id)
-        print(exception_context.value)
-        assert _errors.Path.Lookup.matches(exception_context.value)
-        assert not pathlib.Path(directory).exists()
+        assert not directory.exists()
 
 
-@pytest.mark.skipif(
-    os.getenv('RUN_REAL_PEBBLE_TESTS') != '1',
-    reason='RUN_REAL_PEBBLE_TESTS not set',
-)
 class TestRemovePath:
     @staticmethod
-    def test_target_doesnt_exist(container: ops.Container, tmp_path: pathlib.Path):
+    def test_target_doesnt_exist(file_operations: FileOperations, tmp_path: pathlib.Path):
         file = tmp_path / 'doesnt_exist'
-        # with container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).remove_path(file)
-        print(exception_context.value)
-        assert _errors.Path.FileNotFound.matches(exception_context.value)
-        # without container
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().remove_path(file)
-        print(exception_context.value)
+            file_operations.remove_path(file)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.FileNotFound.matches(exception_context.value)
 
     @staticmethod
-    def test_target_parent_doesnt_exist(container: ops.Container, tmp_path: pathlib.Path):
+    def test_target_parent_doesnt_exist(file_operations: FileOperations, tmp_path: pathlib.Path):
         file = tmp_path / 'does/not/exist'
-        # with container
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).remove_path(file)
-        print(exception_context.value)
-        assert _errors.Path.FileNotFound.matches(exception_context.value)
-        # without container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().remove_path(file)
-        print(exception_context.value)
+            file_operations.remove_path(file)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.FileNotFound.matches(exception_context.value)
 
     @staticmethod
-    def test_path_not_absolute(container: ops.Container):
-        path = pathlib.Path('path.test')
+    def test_path_not_absolute(file_operations: FileOperations):
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).remove_path(path)
-        assert _errors.Path.RelativePath.matches(exception_context.value)
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().remove_path(path)
+            file_operations.remove_path(RELATIVE_PATH)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.RelativePath.matches(exception_context.value)
 
 
-@pytest.mark.skipif(
-    os.getenv('RUN_REAL_PEBBLE_TESTS') != '1',
-    reason='RUN_REAL_PEBBLE_TESTS not set',
-)
 class TestPush:
     @staticmethod
-    def test_str_ok(container: ops.Container, tmp_path: pathlib.Path):
-        path = tmp_path / 'path.test'
-        contents = 'hello world'
-        # container
-        assert not path.exists()
-        FileOperations(container).push(path=path, source=contents)
-        assert path.read_text() == contents
-        path.unlink()
-        # no container
-        assert not path.exists()
-        FileOperations().push(path=path, source=contents)
-        assert path.read_text() == contents
-
-    @staticmethod
-    def test_bytes_ok(container: ops.Container, tmp_path: pathlib.Path):
-        path = tmp_path / 'path.test'
-        contents = b'hello world'
-        # container
-        assert not path.exists()
-        FileOperations(container).push(path=path, source=contents)
-        assert path.read_bytes() == contents
-        path.unlink()
-        # no container
-        assert not path.exists()
-        FileOperations().push(path=path, source=contents)
-        assert path.read_bytes() == contents
-
-    @staticmethod
-    def test_text_file_ok(container: ops.Container, tmp_path: pathlib.Path):
-        path = tmp_path / 'path.test'
-        contents = 'hello world'
-        source = tmp_path / 'source.test'
-        source.write_text(contents)
-        # container
-        assert not path.exists()
-        with source.open() as f:
-            FileOperations(container).push(path=path, source=f)
-        assert path.read_text() == contents
-        path.unlink()
-        # no container
-        assert not path.exists()
-        with source.open() as f:
-            FileOperations().push(path=path, source=f)
-        assert path.read_text() == contents
-
-    @staticmethod
-    def test_binary_file_ok(container: ops.Container, tmp_path: pathlib.Path):
+    @pytest.mark.parametrize(
+        ('contents', 'file_mode'),
+        [('hello world', None), (b'hello world', None), ('hello world', 'r'), (ALL_BYTES, 'rb')],
+        ids=['str', 'bytes', 'text_file', 'binary_file'],
+    )
+    def test_ok(file_operations: FileOperations, tmp_path: pathlib.Path, contents: str | bytes, file_mode: str | None):
+        """Push contents directly, or from a file opened with file_mode if given."""
         path = tmp_path / 'path.test'
-        contents = bytearray(range(256))
-        source = tmp_path / 'source.test'
-        source.write_bytes(contents)
-        # container
-        assert not path.exists()
-        with source.open('rb') as f:
-            FileOperations(container).push(path=path, source=f)
-        assert path.read_bytes() == contents
-        path.unlink()
-        # no container
-        assert not path.exists()
-        with source.open('rb') as f:
-            FileOperations().push(path=path, source=f)
-        assert path.read_bytes() == contents
-
-    @staticmethod
-    def test_path_not_absolute(container: ops.Container):
-        path = pathlib.Path('path.test')
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).push(path, source='')
-        assert _errors.Path.RelativePath.matches(exception_context.value)
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().push(path, source='')
+        read = path.read_text if isinstance(contents, str) else path.read_bytes
+        if file_mode is None:
+            file_operations.push(path=path, source=contents)
+        else:
+            source = tmp_path / 'source.test'
+            if isinstance(contents, str):
+                source.write_text(contents)
+            else:
+                source.write_bytes(contents)
+            with source.open(file_mode) as f:
+                file_operations.push(path=path, source=f)
+        assert read() == contents
+
+    @staticmethod
+    def test_path_not_absolute(file_operations: FileOperations):
+        with pytest.raises(ops.pebble.PathError) as exception_context:
+            file_operations.push(RELATIVE_PATH, source='')
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.RelativePath.matches(exception_context.value)
 
     @staticmethod
-    @pytest.mark.parametrize('mode', ALL_MODES)
-    def test_subdirectory_make_dirs(container: ops.Container, tmp_path: pathlib.Path, mode: str | None):
-        permissions = int(f'0o{mode}', base=8) if mode is not None else mode
-        directory = tmp_path / 'directory'
-        subdirectory = directory / 'subdirectory'
-        path = subdirectory / 'path.test'
+    @pytest.mark.parametrize(('mode', 'permissions'), mode_params(ALL_MODES))
+    def test_subdirectory_make_dirs(
+        container: ops.Container,
+        tmp_path: pathlib.Path,
+        mode: str | None,
+        permissions: int | None,
+        write_for_debugging: Callable[..., None],
+    ):
+        path = tmp_path / 'directory' / 'subdirectory' / 'path.test'
         contents = 'hello world'
-        # container
-        assert not path.exists()
-        assert not subdirectory.exists()
-        assert not directory.exists()
-        FileOperations(container).push(path=path, source=contents, make_dirs=True, permissions=permissions)
-        assert directory.exists()
-        assert subdirectory.exists()
-        assert path.exists()
-        info_pat_c = _fileinfo.from_path(path)
-        info_sub_c = _fileinfo.from_path(subdirectory)
-        info_dir_c = _fileinfo.from_path(directory)
-        os.chmod(path, 0o400)
-        assert path.read_text() == contents
-        # cleanup
-        path.unlink()
-        rmdir(subdirectory)
-        rmdir(directory)
-        # no container
-        assert not path.exists()
-        assert not subdirectory.exists()
-        assert not directory.exists()
-        FileOperations().push(path=path, source=contents, make_dirs=True, permissions=permissions)
-        assert directory.exists()
-        assert subdirectory.exists()
-        assert path.exists()
-        info_pat = _fileinfo.from_path(path)
-        info_sub = _fileinfo.from_path(subdirectory)
-        info_dir = _fileinfo.from_path(directory)
-        os.chmod(path, 0o400)
-        assert path.read_text() == contents
-        # cleanup -- pytest is bad at cleaning up when permissions are funky
-        path.unlink()
-        rmdir(subdirectory)
-        rmdir(directory)
-        # comparison
+        infos_c = push_make_dirs(FileOperations(container), path, contents, permissions)
+        infos = push_make_dirs(FileOperations(), path, contents, permissions)
         write_for_debugging(
             f'push_subdirectory_make_dirs_{mode}',
-            info_pat_c=info_pat_c,
-            info_pat=info_pat,
-            info_sub_c=info_sub_c,
-            info_sub=info_sub,
-            info_dir_c=info_dir_c,
-            info_dir=info_dir,
+            infos_c=infos_c,
+            infos=infos,
         )
-        assert_fileinfo_eq(info_pat, info_pat_c)
-        assert_fileinfo_eq(info_sub, info_sub_c)
-        assert_fileinfo_eq(info_dir, info_dir_c)
+        for info, info_c in zip(infos, infos_c):
+            assert_fileinfo_eq(info, info_c)
 
     @staticmethod
-    def test_subdirectory_no_make_dirs(container: ops.Container, tmp_path: pathlib.Path):
+    def test_subdirectory_no_make_dirs(file_operations: FileOperations, tmp_path: pathlib.Path):
         directory = tmp_path / 'directory'
         subdirectory = directory / 'subdirectory'
         path = subdirectory / 'path.test'
         contents = 'hello world'
-        # container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).push(path=path, source=contents)
-        print(exception_context.value)
-        assert _errors.Path.FileNotFound.matches(exception_context.value)
-        assert not path.exists()
-        assert not subdirectory.exists()
-        assert not directory.exists()
-        # no container
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().make_dir(subdirectory)
-        print(exception_context.value)
+            file_operations.push(path=path, source=contents)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.FileNotFound.matches(exception_context.value)
-        assert not path.exists()
-        assert not subdirectory.exists()
-        assert not directory.exists()
+        assert not directory.exists()  # so neither does anything below it
 
 
-@pytest.mark.skipif(
-    os.getenv('RUN_REAL_PEBBLE_TESTS') != '1',
-    reason='RUN_REAL_PEBBLE_TESTS not set',
-)
 class TestPull:
     @staticmethod
-    def test_str_ok(container: ops.Container, tmp_path: pathlib.Path):
-        path = tmp_path / 'path.test'
-        contents = 'hello world'
-        path.write_text(contents)
-        # container
-        f = FileOperations(container).pull(path)
-        assert f.read() == contents
-        # no container
-        f = FileOperations().pull(path)
-        assert f.read() == contents
-
-    @staticmethod
-    def test_bytes_ok(container: ops.Container, tmp_path: pathlib.Path):
+    @pytest.mark.parametrize(
+        ('contents', 'encoding'),
+        [('hello world', 'utf-8'), (b'hello world', None)],
+        ids=['str', 'bytes'],
+    )
+    def test_ok(file_operations: FileOperations, tmp_path: pathlib.Path, contents: str | bytes, encoding: str | None):
         path = tmp_path / 'path.test'
-        contents = b'hello world'
-        path.write_bytes(contents)
-        # container
-        f = FileOperations(container).pull(path, encoding=None)
-        assert f.read() == contents
-        # no container
-        f = FileOperations().pull(path, encoding=None)
+        if isinstance(contents, str):
+            path.write_text(contents, encoding=encoding)
+        else:
+            path.write_bytes(contents)
+        f = file_operations.pull(path, encoding=encoding)
         assert f.read() == contents
 
     @staticmethod
-    def test_str_bad_encoding_argument(container: ops.Container, tmp_path: pathlib.Path):
+    def test_str_bad_encoding_argument(file_operations: FileOperations, tmp_path: pathlib.Path):
         path = tmp_path / 'path.test'
         contents = 'hello world'
         path.write_text(contents)
-        # container
         with pytest.raises(LookupError):
-            FileOperations(container).pull(path, encoding='bad')
-        # no container
-        with pytest.raises(LookupError):
-            FileOperations().pull(path, encoding='bad')
+            file_operations.pull(path, encoding='bad')
 
     @staticmethod
-    def test_str_encoding_doesnt_match(container: ops.Container, tmp_path: pathlib.Path):
+    def test_str_encoding_doesnt_match(file_operations: FileOperations, tmp_path: pathlib.Path):
         path = tmp_path / 'path.test'
-        contents = bytes(range(256))
+        contents = ALL_BYTES
         path.write_bytes(contents)
-        # container
-        f = FileOperations(container).pull(path, encoding='utf-8')
-        with pytest.raises(UnicodeDecodeError):
-            f.read()
-        # no container
-        f = FileOperations().pull(path, encoding='utf-8')
+        f = file_operations.pull(path, encoding='utf-8')
         with pytest.raises(UnicodeDecodeError):
             f.read()
 
     @staticmethod
-    def test_target_doesnt_exist(container: ops.Container, tmp_path: pathlib.Path):
+    def test_target_doesnt_exist(file_operations: FileOperations, tmp_path: pathlib.Path):
         path = tmp_path / 'path.test'
-        # container
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).pull(path)
-        print(exception_context.value)
-        assert _errors.Path.FileNotFound.matches(exception_context.value)
-        # no container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().pull(path)
-        print(exception_context.value)
+            file_operations.pull(path)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.FileNotFound.matches(exception_context.value)
 
     @staticmethod
-    def test_no_permission(container: ops.Container, tmp_path: pathlib.Path):
+    def test_no_permission(file_operations: FileOperations, tmp_path: pathlib.Path):
         path = tmp_path / 'path.test'
-        path.write_text('')
-        os.chmod(path, 0)
-        # container
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o000))
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).pull(path)
-        print(exception_context.value)
-        assert _errors.Path.Permission.matches(exception_context.value)
-        # no container
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().pull(path)
-        print(exception_context.value)
+            file_operations.pull(path)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.Permission.matches(exception_context.value)
 
     @staticmethod
-    def test_path_not_absolute(container: ops.Container):
-        path = pathlib.Path('path.test')
+    def test_path_not_absolute(file_operations: FileOperations):
         with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations(container).pull(path)
-        assert _errors.Path.RelativePath.matches(exception_context.value)
-        with pytest.raises(ops.pebble.PathError) as exception_context:
-            FileOperations().pull(path)
+            file_operations.pull(RELATIVE_PATH)
+        logger.debug('%s', exception_context.value)
         assert _errors.Path.RelativePath.matches(exception_context.value)
 
 
-def fileinfo_eq(self: ops.pebble.FileInfo, other: ops.pebble.FileInfo, include_last_modified: bool = False) -> bool:
-    return all(
-        getattr(self, name) == getattr(other, name)
-        for name in dir(self)
-        if (
-            not name.startswith('_')
-            and (include_last_modified or name != "last_modified")
-        )
-    )
+def assert_fileinfo_list_eq(xs: list[ops.pebble.FileInfo], ys: list[ops.pebble.FileInfo]) -> None:
+    assert len(xs) == len(ys)
+    for x, y in zip(xs, ys):
+        assert_fileinfo_eq(x, y)
 
 
 def assert_fileinfo_eq(self: ops.pebble.FileInfo, other: ops.pebble.FileInfo, include_last_modified: bool = False) -> None:
-    for name in dir(self):
-        if name.startswith('_'):
-            continue
-        if not include_last_modified and name == "last_modified":
-            continue
+    names = FILEINFO_ATTRS + ('last_modified',) if include_last_modified else FILEINFO_ATTRS
+    get_values = operator.attrgetter(*names)
+    if get_values(self) == get_values(other):
+        return
+    # compare field by field only on mismatch, so the failure names the field
+    for name in names:
         assert (name, getattr(self, name)) == (name, getattr(other, name))
 
 
-def write_for_debugging(identifier: str, **kwargs: object):
-    if DEBUG:
-        out = pathlib.Path('.tmp') / f'{identifier}.py'
-        out.parent.mkdir(exist_ok=True)
-        out.write_text('\n'.join(f'{k} = {v}' for k, v in kwargs.items()))
-        subprocess.run(['ruff', 'format', '--config', 'line-length=200', str(out)])
+def make_subdirectory_bad_permissions(
+    file_operations: FileOperations,
+    subdirectory: pathlib.Path,
+    permissions: int | None,
+    created: bool,
+    absent: Iterable[pathlib.Path] = (),
+) -> list[ops.pebble.FileInfo]:
+    """Make subdirectory and its parent with permissions that stop make_dir from succeeding.
+
+    Returns info for the parent directory, and for subdirectory if it was created anyway.
+    Both are removed afterwards.
+    """
+    directory = subdirectory.parent
+    assert not directory.exists()  # so neither does anything below it
+    with pytest.raises(ops.pebble.PathError) as exception_context:
+        file_operations.make_dir(subdirectory, make_parents=True, permissions=permissions)
+    logger.debug('%s', exception_context.value)
+    assert _errors.Path.Permission.matches(exception_context.value)
+    assert directory.exists()
+    infos = [_fileinfo.from_path(directory)]
+    os.chmod(directory, 0o755)
+    assert subdirectory.exists() == created
+    if created:
+        infos.append(_fileinfo.from_path(subdirectory))
+    for path in absent:
+        assert not path.exists()
+    # cleanup -- pytest is bad at cleaning up when permissions are funky
+    rmtree(directory)
+    return infos
+
+
+def push_make_dirs(
+    file_operations: FileOperations,
+    path: pathlib.Path,
+    contents: str,
+    permissions: int | None,
+) -> list[ops.pebble.FileInfo]:
+    """Push contents to path, making its parent and grandparent directories.
+
+    Returns info for path, its parent and its grandparent, which are all removed afterwards.
+    """
+    subdirectory = path.parent
+    directory = subdirectory.parent
+    assert not directory.exists()  # so neither does anything below it
+    file_operations.push(path=path, source=contents, make_dirs=True, permissions=permissions)
+    assert path.exists()
+    infos = [_fileinfo.from_path(p) for p in (path, subdirectory, directory)]
+    os.chmod(path, 0o400)
+    assert path.read_text() == contents
+    # cleanup -- pytest is bad at cleaning up when permissions are funky
+    rmtree(directory)
+    return infos
 
 
 def rmdir(path: pathlib.Path) -> None:
     os.chmod(path, 0o755)
-    path.rmdir()
+    os.rmdir(path)
+
+
+def rmtree(path: pathlib.Path) -> None:
+    # make every directory readable first, as shutil.rmtree needs to list them
+    os.chmod(path, 0o755)
+    for dirpath, dirnames, _ in os.walk(path):
+        for dirname in dirnames:
+            os.chmod(os.path.join(dirpath, dirname), 0o755)
+    shutil.rmtree(path)